@@ -4,9 +4,11 @@ from discord.ext import commands
 import gspread
 import json
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import APIError
 from datetime import datetime
+from utils.sheet_snapshot import SNAPSHOT
 
 with open("config.json") as f:
     config = json.load(f)
@@ -91,7 +93,7 @@ class AddToDB(commands.Cog):
     async def addtodb(self, interaction: discord.Interaction, roblox_username: str, wb_plate: str):
         await interaction.response.defer(ephemeral=True)
         try:
-            values = SHEET.get_all_values()
+            snapshot = await SNAPSHOT.fresh(WORKSHEET_NAME)
             COL_RANK = 3
             COL_USERNAME = 4
             COL_WBPLATE = 5
@@ -99,9 +101,9 @@ class AddToDB(commands.Cog):
             COL_MINUTES = 7
             COL_DISCIPLINARY = 8
             baker_rows = []
-            for i, row in enumerate(values):
-                if len(row) >= COL_RANK and row[COL_RANK - 1].strip().lower() == "baker":
-                    baker_rows.append(i + 1)
+            for i, rank in enumerate(snapshot.column(WORKSHEET_NAME, COL_RANK), start=1):
+                if rank.strip().lower() == "baker":
+                    baker_rows.append(i)
             today_date = datetime.now().strftime("%m/%d/%Y")
             if not baker_rows:
                 new_row = ["", "", "Baker", roblox_username, wb_plate, today_date, 0, "None"]
@@ -111,33 +113,43 @@ class AddToDB(commands.Cog):
                     ephemeral=True
                 )
                 return
-            placed = False
-            for row_idx in baker_rows:
-                username_cell = SHEET.cell(row_idx, COL_USERNAME).value
-                if not username_cell:
-                    SHEET.update_cell(row_idx, COL_USERNAME, roblox_username)
-                    SHEET.update_cell(row_idx, COL_WBPLATE, wb_plate)
-                    SHEET.update_cell(row_idx, COL_HIREDATE, today_date)
-                    SHEET.update_cell(row_idx, COL_MINUTES, 0)
-                    SHEET.update_cell(row_idx, COL_DISCIPLINARY, "None")
-                    placed = True
-                    break
-            if not placed:
-                last_baker_row = baker_rows[-1]
-                insert_formatted_row(last_baker_row)
-                new_row_index = last_baker_row + 1
-                copy_borders(last_baker_row, new_row_index)
-                SHEET.update_cell(new_row_index, COL_RANK, "Baker")
-                SHEET.update_cell(new_row_index, COL_USERNAME, roblox_username)
-                SHEET.update_cell(new_row_index, COL_WBPLATE, wb_plate)
-                SHEET.update_cell(new_row_index, COL_HIREDATE, today_date)
-                SHEET.update_cell(new_row_index, COL_MINUTES, 0)
-                SHEET.update_cell(new_row_index, COL_DISCIPLINARY, "None")
+            empty_row = next((r for r in baker_rows if not snapshot.cell(WORKSHEET_NAME, r, COL_USERNAME)), None)
+            check_row = empty_row or baker_rows[-1]
+            live = SHEET.get(f"C{check_row}:D{check_row}")
+            live_row = (live[0] if live else []) + ["", ""]
+            if live_row[0].strip().lower() != "baker" or (empty_row and live_row[1].strip()):
+                SNAPSHOT.invalidate()
+                await interaction.followup.send(
+                    "❌ The database changed while this command ran. Please try again.",
+                    ephemeral=True
+                )
+                return
+            try:
+                if empty_row:
+                    SHEET.update_cell(empty_row, COL_USERNAME, roblox_username)
+                    SHEET.update_cell(empty_row, COL_WBPLATE, wb_plate)
+                    SHEET.update_cell(empty_row, COL_HIREDATE, today_date)
+                    SHEET.update_cell(empty_row, COL_MINUTES, 0)
+                    SHEET.update_cell(empty_row, COL_DISCIPLINARY, "None")
+                else:
+                    last_baker_row = baker_rows[-1]
+                    insert_formatted_row(last_baker_row)
+                    new_row_index = last_baker_row + 1
+                    copy_borders(last_baker_row, new_row_index)
+                    SHEET.update_cell(new_row_index, COL_RANK, "Baker")
+                    SHEET.update_cell(new_row_index, COL_USERNAME, roblox_username)
+                    SHEET.update_cell(new_row_index, COL_WBPLATE, wb_plate)
+                    SHEET.update_cell(new_row_index, COL_HIREDATE, today_date)
+                    SHEET.update_cell(new_row_index, COL_MINUTES, 0)
+                    SHEET.update_cell(new_row_index, COL_DISCIPLINARY, "None")
+            except Exception:
+                SNAPSHOT.invalidate()
+                raise
             await interaction.followup.send(
                 f"✅ Successfully added **{roblox_username}** with plate `{wb_plate}` as a Baker.",
                 ephemeral=True
             )
-        except APIError as e:
+        except (APIError, HttpError) as e:
             await interaction.followup.send(f"❌ Google Sheets error: {e}", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ Unexpected error: {e}", ephemeral=True)
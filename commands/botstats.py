@@ -0,0 +1,57 @@
+import json
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.stall_detector import StallDetector
+
+with open("config.json") as f:
+    config = json.load(f)
+
+MANAGEMENT_ROLE_ID = int(config["MANAGEMENT_ROLE_ID"])
+STALL_PROFILING = str(config.get("STALL_PROFILING", False)).strip().lower() == "true"
+STALL_THRESHOLD_MS = int(config.get("STALL_THRESHOLD_MS", 250))
+STALL_LOG_FILE = config.get("STALL_LOG_FILE", "stalls.log")
+
+
+class BotStats(commands.GroupCog, group_name="botstats", group_description="Bot diagnostics for management."):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.detector: StallDetector | None = None
+
+    async def cog_load(self):
+        if STALL_PROFILING:
+            self.detector = StallDetector(threshold=STALL_THRESHOLD_MS / 1000, log_file=STALL_LOG_FILE)
+            self.detector.start()
+            print(f"🩺 Stall profiling enabled (threshold {STALL_THRESHOLD_MS}ms).")
+
+    async def cog_unload(self):
+        if self.detector:
+            self.detector.stop()
+
+    @app_commands.command(name="stalls", description="Show recent event loop stalls and what caused them.")
+    async def stalls(self, interaction: discord.Interaction):
+        if not isinstance(interaction.user, discord.Member) or not any(r.id == MANAGEMENT_ROLE_ID for r in interaction.user.roles):
+            await interaction.response.send_message("You do not have permission to use this command.", ephemeral=True)
+            return
+
+        if self.detector is None:
+            await interaction.response.send_message("Stall profiling is disabled. Set `STALL_PROFILING` to `true` in config.json to enable it.", ephemeral=True)
+            return
+
+        stalls = self.detector.recent(10)
+        embed = discord.Embed(title="🩺 Event Loop Stalls", color=discord.Color.orange() if stalls else discord.Color.green())
+        embed.set_footer(text=f"Threshold {STALL_THRESHOLD_MS}ms • showing latest {len(stalls)}")
+        if not stalls:
+            embed.description = "No stalls recorded."
+        for stall in stalls:
+            who = f"{stall['command']} by <@{stall['user_id']}>" if stall["command"] else "No active interaction"
+            embed.add_field(
+                name=f"{stall['duration_ms']}ms",
+                value=f"{who} • <t:{int(stall['time'].timestamp())}:R>\n`{stall['call_site']}`"[:1024],
+                inline=False,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(BotStats(bot))
@@ -7,6 +7,7 @@ import json
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 from gspread.exceptions import APIError
+from utils.sheet_snapshot import SNAPSHOT
 
 with open("config.json") as f:
     config = json.load(f)
@@ -16,6 +17,7 @@ GOOGLE_SHEET_NAME = config["GOOGLE_SHEET_NAME"]
 GOOGLE_CREDENTIALS_FILE = config["GOOGLE_CREDENTIALS_FILE"]
 SHIFT_CHANNEL_ID = int(config["SHIFT_CHANNEL_ID"])
 MANAGEMENT_ROLE_ID = int(config["MANAGEMENT_ROLE_ID"])
+WORKSHEET_NAME = config["WORKSHEET_NAME"]
 
 def get_gsheet():
     scope = [
@@ -25,7 +27,7 @@ def get_gsheet():
     ]
     creds = ServiceAccountCredentials.from_json_keyfile_name(GOOGLE_CREDENTIALS_FILE, scope)
     client = gspread.authorize(creds)
-    return client.open(GOOGLE_SHEET_NAME).sheet1
+    return client.open(GOOGLE_SHEET_NAME).worksheet(WORKSHEET_NAME)
 
 def discord_ts(dt: datetime, style: str = "t") -> str:
     if dt.tzinfo is None:
@@ -228,17 +230,17 @@ class DutyLog(commands.Cog):
             return True
         display_name = data.get("display_name") or (member.display_name if isinstance(member, discord.Member) else str(user_id))
         try:
-            sheet = get_gsheet()
-            usernames = sheet.col_values(4)
-            row_index = None
-            dn_l = display_name.strip().lower()
-            for i, name in enumerate(usernames, start=1):
-                if name and name.strip().lower() == dn_l:
-                    row_index = i
-                    break
+            snapshot = await SNAPSHOT.fresh(WORKSHEET_NAME)
+            row_index = snapshot.find_row(WORKSHEET_NAME, 4, display_name)
             if row_index is None:
                 raise RuntimeError(f"No row found in column D for display name '{display_name}'.")
-            current_value = sheet.cell(row_index, 7).value
+            sheet = get_gsheet()
+            live = sheet.get(f"D{row_index}:G{row_index}")
+            live_row = live[0] if live else []
+            if not live_row or live_row[0].strip().lower() != display_name.strip().lower():
+                SNAPSHOT.invalidate()
+                raise RuntimeError("The database changed while approving this shift. Please try again.")
+            current_value = live_row[3] if len(live_row) > 3 else ""
             try:
                 current_minutes = int(str(current_value).strip()) if current_value is not None and str(current_value).strip().isdigit() else 0
             except:
@@ -7,6 +7,8 @@ from discord.ext import commands
 import gspread
 from gspread.exceptions import APIError
 from google.oauth2.service_account import Credentials
+from googleapiclient.errors import HttpError
+from utils.sheet_snapshot import SNAPSHOT, SheetTable
 
 with open("config.json") as f:
     config = json.load(f)
@@ -16,6 +18,7 @@ GOOGLE_CREDENTIALS_FILE = config["GOOGLE_CREDENTIALS_FILE"]
 STAFF_WORKSHEET_NAME = config["WORKSHEET_NAME"]
 EMPLOYMENT_WORKSHEET_NAME = config.get("EMPLOYMENT_WORKSHEET_NAME", "Employment Records")
 MANAGEMENT_ROLE_ID = int(config["MANAGEMENT_ROLE_ID"])
+CHANGED_MESSAGE = "❌ The database changed while this command ran. Please try again."
 EMP_FIRST_DATA_ROW = int(config.get("EMP_FIRST_DATA_ROW", 4))
 
 SCOPES = [
@@ -51,13 +54,16 @@ def _fmt_api_error(e: APIError) -> str:
     return str(e)
 
 
-async def _next_emp_row_below_last() -> int:
-    col_d = await _retry_429(EMP_SHEET.get, f"D{EMP_FIRST_DATA_ROW}:D")
+async def _next_emp_row_below_last(snapshot: SheetTable) -> int | None:
+    col_d = snapshot.column(EMPLOYMENT_WORKSHEET_NAME, 4, start=EMP_FIRST_DATA_ROW)
     last_idx = 0
-    for i, row in enumerate(col_d, start=1):
-        if (row[0] if row else "").strip():
+    for i, cell in enumerate(col_d, start=1):
+        if cell.strip():
             last_idx = i
     dest_row = EMP_FIRST_DATA_ROW + last_idx
+    below = await _retry_429(EMP_SHEET.get, f"D{dest_row}:D")
+    if any((row[0] if row else "").strip() for row in below or []):
+        return None
     if dest_row > EMP_SHEET.row_count:
         await _retry_429(EMP_SHEET.add_rows, dest_row - EMP_SHEET.row_count)
     return dest_row
@@ -103,14 +109,8 @@ class Fire(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            d_col = await _retry_429(STAFF_SHEET.get, "D4:D")
-            target = username.strip().lower()
-            row_index = None
-            for idx, row in enumerate(d_col, start=4):
-                cell = (row[0] if row else "").strip()
-                if cell and cell.lower() == target:
-                    row_index = idx
-                    break
+            snapshot = await SNAPSHOT.fresh(STAFF_WORKSHEET_NAME, EMPLOYMENT_WORKSHEET_NAME)
+            row_index = snapshot.find_row(STAFF_WORKSHEET_NAME, 4, username, start=4)
             if row_index is None:
                 await interaction.followup.send(
                     f"❌ Username **{username}** not found in Staff Database (column D)."
@@ -120,22 +120,44 @@ class Fire(commands.Cog):
             row_vals = await _retry_429(STAFF_SHEET.get, f"C{row_index}:D{row_index}")
             rank = (row_vals[0][0] if row_vals and row_vals[0] else "") or ""
             uname = (row_vals[0][1] if row_vals and len(row_vals[0]) > 1 else "") or ""
+            if uname.strip().lower() != username.strip().lower():
+                SNAPSHOT.invalidate()
+                await interaction.followup.send(CHANGED_MESSAGE)
+                return
 
-            dest_row = await _next_emp_row_below_last()
-            await _retry_429(
-                EMP_SHEET.update,
-                f"C{dest_row}:G{dest_row}",
-                [[rank, uname, reason, termination_type.value, approved_by]],
-                value_input_option="USER_ENTERED",
-            )
+            dest_row = await _next_emp_row_below_last(snapshot)
+            if dest_row is None:
+                SNAPSHOT.invalidate()
+                await interaction.followup.send(CHANGED_MESSAGE)
+                return
 
-            await _retry_429(STAFF_SHEET.delete_rows, row_index)
+            try:
+                await _retry_429(
+                    EMP_SHEET.update,
+                    f"C{dest_row}:G{dest_row}",
+                    [[rank, uname, reason, termination_type.value, approved_by]],
+                    value_input_option="USER_ENTERED",
+                )
+
+                check = await _retry_429(STAFF_SHEET.get, f"D{row_index}")
+                if (check[0][0] if check and check[0] else "") != uname:
+                    SNAPSHOT.invalidate()
+                    await interaction.followup.send(
+                        f"❌ The Staff Database changed before **{uname}** could be removed. "
+                        f"They were logged to Employment Records row {dest_row}; remove their Staff Database row by hand."
+                    )
+                    return
+
+                await _retry_429(STAFF_SHEET.delete_rows, row_index)
+            except Exception:
+                SNAPSHOT.invalidate()
+                raise
 
             await interaction.followup.send(
                 f"✅ Fired **{uname}** ({rank}). Logged to Employment Records row {dest_row} and removed from Staff Database."
             )
 
-        except APIError as e:
+        except (APIError, HttpError) as e:
             await interaction.followup.send(f"❌ Google Sheets error: {_fmt_api_error(e)}")
         except Exception as e:
             await interaction.followup.send(f"❌ Unexpected error: {e}")
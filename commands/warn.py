@@ -5,6 +5,8 @@ import json
 import gspread
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import APIError
+from googleapiclient.errors import HttpError
+from utils.sheet_snapshot import SNAPSHOT
 
 with open("config.json") as f:
     config = json.load(f)
@@ -53,25 +55,27 @@ class Warn(commands.Cog):
             dm_ok = False
 
         try:
-            names = SHEET.col_values(4)
-            target = user.display_name.strip().lower()
-            row_index = None
-            for i, name in enumerate(names, start=1):
-                if name and name.strip().lower() == target:
-                    row_index = i
-                    break
+            snapshot = await SNAPSHOT.fresh(WORKSHEET_NAME)
+            row_index = snapshot.find_row(WORKSHEET_NAME, 4, user.display_name)
 
             if row_index is None:
                 await interaction.followup.send(f"❌ User **{user.display_name}** was not found in column D.")
                 return
 
-            current = SHEET.cell(row_index, 8).value
-            new_value = self.next_warning(current or "")
+            live = SHEET.get(f"D{row_index}:H{row_index}")
+            live_row = live[0] if live else []
+            if not live_row or live_row[0].strip().lower() != user.display_name.strip().lower():
+                SNAPSHOT.invalidate()
+                await interaction.followup.send("❌ The database changed while this command ran. Please try again.")
+                return
+
+            current = live_row[4] if len(live_row) > 4 else ""
+            new_value = self.next_warning(current)
             SHEET.update_cell(row_index, 8, new_value)
 
             tail = "" if dm_ok else " (DM failed)"
             await interaction.followup.send(f"{user.mention} warned → **{new_value}**. \n\nReason: {reason}{tail}")
-        except APIError as e:
+        except (APIError, HttpError) as e:
             await interaction.followup.send(f"Google Sheets error: {e}")
         except Exception as e:
             await interaction.followup.send(f"Unexpected error: {e}")
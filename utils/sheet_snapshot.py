@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+import gspread
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from google.oauth2.service_account import Credentials
+from gspread.exceptions import APIError
+
+with open("config.json") as f:
+    config = json.load(f)
+
+GOOGLE_SHEET_NAME = config["GOOGLE_SHEET_NAME"]
+GOOGLE_CREDENTIALS_FILE = config["GOOGLE_CREDENTIALS_FILE"]
+STAFF_WORKSHEET_NAME = config["WORKSHEET_NAME"]
+EMPLOYMENT_WORKSHEET_NAME = config.get("EMPLOYMENT_WORKSHEET_NAME", "Employment Records")
+SNAPSHOT_POLL_SECONDS = float(config.get("SNAPSHOT_POLL_SECONDS", 5))
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+RETRY_DELAYS = (0.5, 1.0, 2.5, 5.0)
+
+
+def _rate_limited(e: Exception) -> bool:
+    if isinstance(e, HttpError):
+        return e.resp.status == 429
+    return "429" in str(e)
+
+
+def _with_backoff(fn, *args):
+    for delay in RETRY_DELAYS:
+        try:
+            return fn(*args)
+        except (APIError, HttpError) as e:
+            if not _rate_limited(e):
+                raise
+            time.sleep(delay)
+    return fn(*args)
+
+
+class SheetTable:
+    """One downloaded version of the worksheets, kept column by column.
+
+    A table never changes after it is built, so a command that reads several
+    cells from it always sees the same version of the sheet.
+    """
+
+    def __init__(self, columns: dict[str, list[list[str]]]):
+        self.columns = columns
+
+    def column(self, worksheet: str, col: int, start: int = 1) -> list[str]:
+        cols = self.columns.get(worksheet, [])
+        values = cols[col - 1] if col <= len(cols) else []
+        return values[start - 1:]
+
+    def cell(self, worksheet: str, row: int, col: int) -> str:
+        values = self.column(worksheet, col)
+        return values[row - 1] if row <= len(values) else ""
+
+    def find_row(self, worksheet: str, col: int, value: str, start: int = 1) -> int | None:
+        target = value.strip().lower()
+        for i, cell in enumerate(self.column(worksheet, col, start), start=start):
+            if cell and cell.strip().lower() == target:
+                return i
+        return None
+
+
+class SheetSnapshot:
+    """Local copy of the database worksheets.
+
+    The spreadsheet's Drive ``version``/``modifiedTime`` is polled at most
+    once every ``poll_seconds``. A worksheet is only downloaded again when
+    that revision has moved on since its last download, and all stale
+    worksheets a command asks for come down in a single ``values.batchGet``.
+    Commands must still re-read the row they are about to write live, since
+    Drive metadata can lag behind an edit made by hand.
+    """
+
+    def __init__(self, spread: gspread.Spreadsheet, drive, worksheets: list[str], poll_seconds: float = 5):
+        self.spread = spread
+        self.drive = drive
+        self.worksheets = worksheets
+        self.poll_seconds = poll_seconds
+        self._cached: dict[str, tuple[tuple, list[list[str]]]] = {}
+        self._revision: tuple | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fetch_revision(self) -> tuple:
+        meta = self.drive.files().get(
+            fileId=self.spread.id, fields="version,modifiedTime", supportsAllDrives=True
+        ).execute()
+        return meta.get("version"), meta.get("modifiedTime")
+
+    def _download(self, worksheets: list[str]) -> dict[str, list[list[str]]]:
+        ranges = ["'{}'".format(name.replace("'", "''")) for name in worksheets]
+        result = self.spread.values_batch_get(ranges, params={"majorDimension": "COLUMNS"})
+        return {
+            name: value_range.get("values", [])
+            for name, value_range in zip(worksheets, result.get("valueRanges", []))
+        }
+
+    async def fresh(self, *worksheets: str) -> SheetTable:
+        """Return a table of the given worksheets (all of them by default)."""
+        names = list(worksheets or self.worksheets)
+        async with self._lock:
+            if self._revision is None or time.monotonic() - self._checked_at >= self.poll_seconds:
+                self._revision = await asyncio.to_thread(_with_backoff, self._fetch_revision)
+                self._checked_at = time.monotonic()
+            revision = self._revision
+            stale = [name for name in names if name not in self._cached or self._cached[name][0] != revision]
+            if stale:
+                downloaded = await asyncio.to_thread(_with_backoff, self._download, stale)
+                for name in stale:
+                    self._cached[name] = (revision, downloaded.get(name, []))
+            return SheetTable({name: self._cached[name][1] for name in names})
+
+    def invalidate(self):
+        """Drop everything cached, e.g. when a live re-read shows the copy is out of date."""
+        self._revision = None
+        self._cached = {}
+
+
+CREDS = Credentials.from_service_account_file(GOOGLE_CREDENTIALS_FILE, scopes=SCOPES)
+CLIENT = gspread.authorize(CREDS)
+SNAPSHOT = SheetSnapshot(
+    CLIENT.open(GOOGLE_SHEET_NAME),
+    build("drive", "v3", credentials=CREDS),
+    [STAFF_WORKSHEET_NAME, EMPLOYMENT_WORKSHEET_NAME],
+    SNAPSHOT_POLL_SECONDS,
+)
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+
+import discord
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY_PREFIXES = tuple({os.path.abspath(p) + os.sep for p in (sys.prefix, sys.base_prefix, sys.exec_prefix)})
+
+
+def _interaction_label(interaction: discord.Interaction) -> str:
+    command = interaction.command
+    if command is not None:
+        return f"/{command.qualified_name}"
+    data = interaction.data or {}
+    custom_id = data.get("custom_id")
+    if custom_id:
+        return f"button:{custom_id}"
+    return str(interaction.type)
+
+
+def _find_interaction(frame):
+    while frame is not None:
+        try:
+            candidate = frame.f_locals.get("interaction")
+        except Exception:
+            candidate = None
+        if isinstance(candidate, discord.Interaction):
+            return candidate
+        frame = frame.f_back
+    return None
+
+
+def _is_project_file(path: str) -> bool:
+    if not path.startswith(PROJECT_ROOT + os.sep) or path == os.path.abspath(__file__):
+        return False
+    if path.startswith(LIBRARY_PREFIXES):
+        return False
+    parts = path.split(os.sep)
+    return "site-packages" not in parts and "dist-packages" not in parts
+
+
+def _call_site(stack: traceback.StackSummary) -> str:
+    for entry in reversed(stack):
+        path = os.path.abspath(entry.filename)
+        if _is_project_file(path):
+            return f"{os.path.relpath(path, PROJECT_ROOT)}:{entry.lineno} in {entry.name}"
+    if stack:
+        entry = stack[-1]
+        return f"{entry.filename}:{entry.lineno} in {entry.name}"
+    return "unknown"
+
+
+class StallDetector:
+    """Watches event loop responsiveness from a watchdog thread.
+
+    A heartbeat task on the loop records when it last ran. If the watchdog
+    sees no heartbeat for longer than ``threshold`` seconds, it captures the
+    loop thread's stack and the interaction being handled at that moment.
+    The stall is recorded once the loop wakes up again and its length is known.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.05, history: int = 50, log_file: str | None = None):
+        self.threshold = threshold
+        self.interval = interval
+        self.log_file = log_file
+        self.stalls: deque[dict] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._pending: dict | None = None
+        self._unreported: list[dict] = []
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        # A fresh event per start, so a watchdog left over from stop() can never be revived.
+        self._stop = threading.Event()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat(), name="stall-detector-heartbeat")
+        self._thread = threading.Thread(target=self._watch, args=(self._stop,), name="stall-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._thread = None
+
+    def recent(self, limit: int = 10) -> list[dict]:
+        with self._lock:
+            return list(self.stalls)[-limit:][::-1]
+
+    async def _heartbeat(self):
+        while True:
+            beat = time.monotonic()
+            self._last_beat = beat
+            await asyncio.sleep(self.interval)
+            blocked = time.monotonic() - beat - self.interval
+            with self._lock:
+                pending, self._pending = self._pending, None
+            if pending is not None and pending["beat"] == beat and blocked >= self.threshold:
+                pending["duration_ms"] = int(blocked * 1000)
+                del pending["beat"]
+                with self._lock:
+                    self.stalls.append(pending)
+                    self._unreported.append(pending)
+
+    def _watch(self, stop: threading.Event):
+        while not stop.wait(self.interval):
+            self._report_finished()
+            beat = self._last_beat
+            if time.monotonic() - beat - self.interval < self.threshold:
+                continue
+            with self._lock:
+                if self._pending is not None:
+                    continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stall = self._describe(frame)
+            stall["beat"] = beat
+            del frame
+            with self._lock:
+                self._pending = stall
+        self._report_finished()
+
+    def _describe(self, frame) -> dict:
+        stack = traceback.extract_stack(frame)
+        interaction = _find_interaction(frame)
+        stall = {
+            "time": datetime.now(timezone.utc),
+            "command": None,
+            "user": None,
+            "user_id": None,
+            "call_site": _call_site(stack),
+            "stack": "".join(stack.format()),
+        }
+        if interaction is not None:
+            stall["command"] = _interaction_label(interaction)
+            stall["user"] = str(interaction.user)
+            stall["user_id"] = interaction.user.id
+        return stall
+
+    def _report_finished(self):
+        # Printing and file writes happen here on the watchdog thread, never on the loop being measured.
+        with self._lock:
+            finished, self._unreported = self._unreported, []
+        for stall in finished:
+            self._report(stall)
+
+    def _report(self, stall: dict):
+        who = f"{stall['command']} by {stall['user']} ({stall['user_id']})" if stall["command"] else "no active interaction"
+        line = f"⚠️ Event loop blocked for {stall['duration_ms']}ms at {stall['call_site']} — {who}"
+        print(line)
+        if self.log_file:
+            try:
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write(f"[{stall['time'].isoformat()}] {line}\n{stall['stack']}\n")
+            except OSError as e:
+                print(f"❌ Failed to write stall log: {e}")